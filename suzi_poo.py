@@ -4,9 +4,9 @@ import sqlite3
 import logging
 import asyncio
 from datetime import datetime
-from io import BytesIO
 
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from telegram import Update
@@ -18,6 +18,11 @@ from telegram.ext import (
     filters,
 )
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 load_dotenv()
 
 TOKEN = os.getenv("TELEGRAM_TOKEN")
@@ -26,6 +31,10 @@ DB_PATH = "suzi_poo.db"
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("suzi")
 
+# Shared session so /pic reuses TCP+TLS connections (picsum redirects to its CDN)
+_HTTP = requests.Session()
+_HTTP.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+
 # ---------------------------- DATABASE ----------------------------
 def init_db():
     con = sqlite3.connect(DB_PATH)
@@ -36,6 +45,10 @@ def init_db():
 
 init_db()
 
+# ---------------------------- HELPERS ----------------------------
+def fetch_image():
+    return _HTTP.get("https://picsum.photos/400", timeout=12).content
+
 # ---------------------------- COMMANDS ----------------------------
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text("Suzi Poo is online!")
@@ -43,11 +56,10 @@ async def start(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def pic(update: Update, context: ContextTypes.DEFAULT_TYPE):
     query = "cat"
     try:
-        data = requests.get("https://picsum.photos/400").content
-        bio = BytesIO(data)
-        bio.name = "img.jpg"
-        await update.message.reply_photo(photo=bio)
-    except:
+        data = await asyncio.to_thread(fetch_image)
+        await update.message.reply_photo(photo=data, filename="img.jpg")
+    except Exception as e:
+        logger.warning("pic: %s", e)
         await update.message.reply_text("Image error.")
 
 async def remind(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -59,7 +71,9 @@ async def echo(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text(f"Suzi saw: {msg}")
 
 # ---------------------------- MAIN ----------------------------
-async def main():
+def main():
+    if uvloop:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     app = ApplicationBuilder().token(TOKEN).build()
 
     app.add_handler(CommandHandler("start", start))
@@ -68,7 +82,7 @@ async def main():
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, echo))
 
     logger.info("Suzi Poo running...")
-    await app.run_polling()
+    app.run_polling()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()